@@ -10,12 +10,19 @@ from datetime import datetime, timedelta
 import json
 import time
 import random
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple
 import re
 import requests
+from requests.adapters import HTTPAdapter
 import numpy as np
 from PIL import Image
 import io
+import html
+import threading
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 
 # Import with fallbacks for Streamlit Cloud compatibility
 try:
@@ -26,12 +33,45 @@ except ImportError:
     def st_autorefresh(interval=30000, key=None, limit=None, debounce=True):
         return 0
 
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+    HTTPX_AVAILABLE = True
+    HTTP_ERRORS = (requests.RequestException, httpx.HTTPError)
+except ImportError:
+    HTTPX_AVAILABLE = False
+    HTTP_ERRORS = (requests.RequestException,)
+
+# JSON codec for metadata cache payloads; sheet cells keep stdlib json text
+try:
+    import orjson
+    def dumps_json(obj) -> str:
+        return orjson.dumps(obj).decode()
+    
+    loads_json = orjson.loads
+except ImportError:
+    def dumps_json(obj) -> str:
+        return json.dumps(obj)
+    
+    loads_json = json.loads
+
+try:
+    from st_aggrid import AgGrid, GridOptionsBuilder
+    AGGRID_AVAILABLE = True
+except ImportError:
+    AGGRID_AVAILABLE = False
+
 try:
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
+    from google.auth.exceptions import GoogleAuthError
+    import httplib2
     YOUTUBE_API_AVAILABLE = True
+    # API, auth and transport (httplib2, socket timeout) failures of a videos.list call
+    YOUTUBE_API_ERRORS = (HttpError, GoogleAuthError, httplib2.HttpLib2Error, OSError)
 except ImportError:
     YOUTUBE_API_AVAILABLE = False
+    YOUTUBE_API_ERRORS = ()
     
 try:
     import gspread
@@ -40,19 +80,37 @@ try:
 except ImportError:
     SHEETS_AVAILABLE = False
     
+# Spreadsheet id inside a Google Sheets URL (.../d/<id>/...)
+_SHEET_ID_RE = re.compile(r'/d/([a-zA-Z0-9_-]+)')
+
+# ISO-8601 video durations (YouTube API format), e.g. PT1H2M3S
+_ISO_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
+def parse_iso_duration(duration_str):
+    """Parse a PT#H#M#S duration to seconds without isodate's object construction"""
+    match = _ISO_DURATION_RE.match(duration_str)
+    if not match:
+        return 0
+    hours, minutes, seconds = (int(value) if value else 0 for value in match.groups())
+    return hours * 3600 + minutes * 60 + seconds
+
 try:
     import isodate
     ISODATE_AVAILABLE = True
 except ImportError:
     ISODATE_AVAILABLE = False
     def parse_duration_simple(duration_str):
-        import re
-        match = re.search(r'PT(?:(\d+)M)?(?:(\d+)S)?', duration_str)
-        if match:
-            minutes = int(match.group(1) or 0)
-            seconds = int(match.group(2) or 0)
-            return minutes * 60 + seconds
+        return parse_iso_duration(duration_str)
+
+def as_int(data: Dict, key: str) -> int:
+    """Read a count field as int, treating missing, None and '' as 0"""
+    value = data.get(key)
+    if value is None or value == '':
         return 0
+    return value if isinstance(value, int) else int(value)
+
+# st.fragment (Streamlit >= 1.37) reruns only the decorated block; older versions rerun the page
+st_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', lambda func: func)
 
 # Page config
 st.set_page_config(
@@ -111,6 +169,16 @@ st.markdown("""
         background-color: #ef4444;
         opacity: 0.6;
     }
+    .log-block {
+        padding: 0.5rem 1rem;
+        border-radius: 6px;
+        margin: 0.25rem 0;
+        font-size: 0.85rem;
+    }
+    .log-success { background: rgba(34, 197, 94, 0.12); color: #22c55e; }
+    .log-error { background: rgba(239, 68, 68, 0.12); color: #ef4444; }
+    .log-warning { background: rgba(237, 137, 54, 0.12); color: #ed8936; }
+    .log-info { background: rgba(66, 153, 225, 0.12); color: #4299e1; }
     @keyframes pulse {
         0% { transform: scale(1); opacity: 1; }
         50% { transform: scale(1.2); opacity: 0.8; }
@@ -119,10 +187,22 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Maximum number of log entries kept in session state (newest first)
+LOG_LIMIT = 100
+# Number of most recent log entries shown in the activity log
+LOG_DISPLAY_LIMIT = 20
+# Log severities, in activity log render order
+LOG_LEVELS = ('SUCCESS', 'ERROR', 'WARNING', 'INFO')
+
+def new_log_levels():
+    """Create empty per-severity log deques"""
+    return {level: deque(maxlen=LOG_LIMIT) for level in LOG_LEVELS}
+
 # Initialize session state
 def init_session_state():
     defaults = {
         'collected_videos': [],
+        'collected_video_ids': set(),  # Mirrors collected_videos for O(1) duplicate checks
         'is_collecting': False,
         'is_rating': False,
         'is_batch_collecting': False,
@@ -136,13 +216,18 @@ def init_session_state():
             'rated': 0, 'moved_to_tobe': 0, 'rejected': 0, 
             'api_calls': 0
         },
-        'logs': [],
+        'logs': deque(maxlen=LOG_LIMIT),
+        'logs_by_level': new_log_levels(),
         'used_queries': set(),
         'system_status': {'type': None, 'message': ''},
         'batch_progress': {'current': 0, 'total': 0, 'results': []},
         'invidious_instance_stats': {},
         'refresh_counter': 0,  # Track autorefresh counter
-        'last_refresh_time': time.time()  # Track last refresh
+        'last_refresh_time': time.time(),  # Track last refresh
+        'videos_df': None,  # Cached DataFrame of collected_videos
+        'videos_df_count': 0,  # Number of collected_videos already in videos_df
+        'last_exported_n': 0,  # Number of collected_videos already exported to Sheets
+        'rejected_video_ids': {}  # Category -> ids that failed validation, kept across runs
     }
     
     for key, value in defaults.items():
@@ -184,6 +269,30 @@ CATEGORIES = {
     }
 }
 
+# Search queries per category, shared by every collector instance
+SEARCH_QUERIES = {
+    'heartwarming': (
+        'soldier surprise homecoming', 'dog reunion owner', 'random acts kindness',
+        'baby first time hearing', 'proposal reaction emotional', 'surprise gift reaction',
+        'homeless man helped', 'teacher surprised students', 'reunion after years'
+    ),
+    'funny': (
+        'unexpected moments caught', 'comedy sketches viral', 'hilarious reactions',
+        'funny animals doing', 'epic fail video', 'instant karma funny',
+        'comedy gold moments', 'prank goes wrong', 'funny kids saying'
+    ),
+    'traumatic': (
+        'shocking moments caught', 'dramatic rescue operation', 'natural disaster footage',
+        'intense police chase', 'survival story real', 'near death experience',
+        'wildfire escape footage', 'building evacuation emergency', 'storm damage aftermath'
+    )
+}
+
+# Columns shown in the collected videos table
+DISPLAY_COLUMNS = ['title', 'category', 'view_count', 'duration_seconds', 'collection_source']
+# Below this many videos the table is rendered without a DataFrame
+SMALL_TABLE_ROWS = 20
+
 # Status management functions
 def show_status_alert():
     """Display system status alerts prominently"""
@@ -238,10 +347,166 @@ def clear_status():
     st.session_state.system_status = {'type': None, 'message': ''}
 
 
+def log_timestamp() -> str:
+    """HH:MM:SS for log lines, built from struct_time without a datetime/strftime"""
+    lt = time.localtime()
+    return f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+
+
+def append_log(log_entry: str, log_type: str):
+    """Record a log entry in the master log and its severity index"""
+    st.session_state.logs.appendleft(log_entry)
+    level = log_type if log_type in st.session_state.logs_by_level else 'INFO'
+    st.session_state.logs_by_level[level].appendleft(log_entry)
+
+
+def _build_videos_df(videos: List[Dict]):
+    """Build the display DataFrame for a list of collected videos"""
+    # Project to the displayed columns as column lists, skipping per-row dicts
+    df = pd.DataFrame(
+        {col: [video.get(col) for video in videos] for col in DISPLAY_COLUMNS},
+        columns=DISPLAY_COLUMNS
+    )
+    
+    # Downcast to shrink the Arrow payload sent to the browser
+    for col in ('view_count', 'duration_seconds'):
+        df[col] = pd.to_numeric(df[col], errors='coerce', downcast='unsigned')
+    for col in ('category', 'collection_source'):
+        df[col] = df[col].astype('category')
+    
+    return df
+
+
+def get_collected_videos_df():
+    """Return the collected videos display DataFrame, appending only new rows"""
+    videos = st.session_state.collected_videos
+    cached = st.session_state.videos_df
+    cached_count = st.session_state.videos_df_count
+    
+    if cached is not None and len(videos) == cached_count:
+        return cached
+    
+    if cached is None or len(videos) < cached_count:
+        df = _build_videos_df(videos)
+    else:
+        # collected_videos only grows, so build just the new tail
+        df = pd.concat([cached, _build_videos_df(videos[cached_count:])], ignore_index=True)
+        # Concatenating categoricals with different categories yields object
+        for col in ('category', 'collection_source'):
+            if not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype('category')
+    
+    st.session_state.videos_df = df
+    st.session_state.videos_df_count = len(videos)
+    return df
+
+
+class TokenBucket:
+    """Thread-safe token bucket; reserve() books a slot and returns the wait before it"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+    
+    def wait_time(self) -> float:
+        """Seconds until the next slot, without booking it"""
+        with self._lock:
+            self._refill()
+            return max(0.0, (1 - self.tokens) / self.rate)
+    
+    def reserve(self) -> float:
+        """Book the next slot and return how long to wait before using it"""
+        # Tokens may go negative, which queues concurrent callers in order
+        with self._lock:
+            self._refill()
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+
+# Metadata fields read by validation and record building (the shape _youtube_to_metadata builds);
+# the rest of a /api/v1/videos payload (expiring stream URLs, recommendations, ...) is not cached
+CACHED_METADATA_FIELDS = (
+    'videoId', 'title', 'lengthSeconds', 'viewCount', 'likeCount', 'commentCount',
+    'publishedText', 'author', 'keywords', 'description', 'collectionSource'
+)
+
+
+class MetadataCache:
+    """SQLite-backed video metadata cache shared across reruns and sessions"""
+    
+    def __init__(self, path: str = "meta_cache.db", ttl_seconds: int = 7 * 24 * 3600):
+        self.ttl_seconds = ttl_seconds
+        # One connection shared by fetch worker threads, serialized by the lock
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta ("
+            "video_id TEXT PRIMARY KEY, json BLOB NOT NULL, "
+            "fetched_at INTEGER NOT NULL, source TEXT)"
+        )
+        # get() only skips expired rows, so drop them here to keep the file bounded
+        self.conn.execute("DELETE FROM meta WHERE fetched_at < ?",
+                          (int(time.time()) - self.ttl_seconds,))
+        self.conn.commit()
+    
+    def get(self, video_id: str) -> Optional[Dict]:
+        """Return cached metadata, or None when missing or older than the TTL"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT json, fetched_at FROM meta WHERE video_id = ?", (video_id,)
+            ).fetchone()
+        
+        if row and time.time() - row[1] < self.ttl_seconds:
+            return loads_json(row[0])
+        return None
+    
+    def put(self, video_id: str, metadata: Dict, source: str = 'invidious'):
+        payload = dumps_json({k: metadata[k] for k in CACHED_METADATA_FIELDS if k in metadata})
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (video_id, json, fetched_at, source) VALUES (?, ?, ?, ?)",
+                (video_id, payload, int(time.time()), source)
+            )
+            self.conn.commit()
+    
+    def clear(self):
+        with self._lock:
+            self.conn.execute("DELETE FROM meta")
+            self.conn.commit()
+
+
+@st.cache_resource(show_spinner=False)
+def get_metadata_cache() -> Optional[MetadataCache]:
+    # The cache is only an optimization, so run without it if the file cannot be opened
+    try:
+        return MetadataCache()
+    except sqlite3.Error as e:
+        set_status('warning', f"Metadata cache unavailable, fetching without it: {str(e)}")
+        return None
+
+
+def clear_metadata_cache():
+    cache = get_metadata_cache()
+    if cache:
+        cache.clear()
+        set_status('info', "Metadata cache cleared")
+
+
 class InvidiousCollector:
     """Enhanced Invidious API collector with robust error handling"""
     
-    def __init__(self):
+    def __init__(self, metadata_cache: Optional[MetadataCache] = None):
+        self.metadata_cache = metadata_cache
+        
         # Official instances from docs.invidious.io
         self.instances = [
             'https://inv.nadeko.net',
@@ -252,37 +517,50 @@ class InvidiousCollector:
         
         # Health tracking
         self.instance_health = {}
-        self.current_instance_index = 0
-        self.failed_instances = set()
+        self._instance_index = {url: i for i, url in enumerate(self.instances)}
+        # Bit i is set while instance i is not behind the circuit breaker
+        self._healthy_mask = (1 << len(self.instances)) - 1
         
         # Request configuration
         self.request_timeout = 10
         self.max_retries = 3
         self.retry_delay_base = 1
-        self.last_request_time = 0
-        self.min_request_interval = 0.5
+        self.requests_per_second_per_instance = 1
+        self.max_concurrent_requests = 8
+        
+        # Guards health tracking and instance selection when requests run on worker threads
+        self._lock = threading.Lock()
+        
+        # Shared keep-alive client so repeat requests to an instance skip the TLS handshake;
+        # with httpx, HTTP/2 also multiplexes concurrent fetches over one connection per host
+        user_agent = 'Mozilla/5.0 (compatible; InvidiousCollector/1.0)'
+        if HTTPX_AVAILABLE:
+            self.session = httpx.Client(
+                http2=True,
+                follow_redirects=True,
+                timeout=self.request_timeout,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+                headers={'User-Agent': user_agent}
+            )
+        else:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=len(self.instances), pool_maxsize=32, max_retries=0)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+            self.session.headers.update({'User-Agent': user_agent})
+        
+        # Per-instance rate limits, so a busy host never throttles the others
+        self._buckets = {
+            url: TokenBucket(rate=self.requests_per_second_per_instance, capacity=2)
+            for url in self.instances
+        }
         
         # Initialize health monitoring
         self._initialize_instance_health()
+        self._refresh_healthy_order()
         
         # Enhanced search queries
-        self.search_queries = {
-            'heartwarming': [
-                'soldier surprise homecoming', 'dog reunion owner', 'random acts kindness',
-                'baby first time hearing', 'proposal reaction emotional', 'surprise gift reaction',
-                'homeless man helped', 'teacher surprised students', 'reunion after years'
-            ],
-            'funny': [
-                'unexpected moments caught', 'comedy sketches viral', 'hilarious reactions',
-                'funny animals doing', 'epic fail video', 'instant karma funny',
-                'comedy gold moments', 'prank goes wrong', 'funny kids saying'
-            ],
-            'traumatic': [
-                'shocking moments caught', 'dramatic rescue operation', 'natural disaster footage',
-                'intense police chase', 'survival story real', 'near death experience',
-                'wildfire escape footage', 'building evacuation emergency', 'storm damage aftermath'
-            ]
-        }
+        self.search_queries = SEARCH_QUERIES
     
     def _initialize_instance_health(self):
         """Initialize health tracking for all instances"""
@@ -298,46 +576,61 @@ class InvidiousCollector:
                 'last_error': None
             }
     
+    def close(self):
+        """Close pooled connections held by the HTTP session"""
+        self.session.close()
+    
     def add_log(self, message: str, log_type: str = "INFO"):
         """Add detailed log entry"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = log_timestamp()
         log_entry = f"[{timestamp}] COLLECTOR {log_type}: {message}"
-        st.session_state.logs.insert(0, log_entry)
-        st.session_state.logs = st.session_state.logs[:100]
+        append_log(log_entry, log_type)
     
-    def get_healthy_instance(self):
-        """Get next healthy instance with circuit breaker logic"""
-        attempts = 0
-        max_attempts = len(self.instances) * 2
-        
-        while attempts < max_attempts:
-            instance = self.instances[self.current_instance_index]
+    def _refresh_healthy_order(self):
+        """Re-rank instances by failures, success rate, then response time"""
+        def rank(instance):
             health = self.instance_health[instance]
-            
-            if (instance not in self.failed_instances and 
-                health['consecutive_failures'] < 3):
-                return instance
-            
-            self.current_instance_index = (self.current_instance_index + 1) % len(self.instances)
-            attempts += 1
+            success_rate = health['successful_requests'] / max(1, health['total_requests'])
+            return (health['consecutive_failures'], -success_rate,
+                    health['response_time'] or float('inf'))
         
-        # All instances failing - return least failed
-        best_instance = min(self.instances, 
-                          key=lambda x: self.instance_health[x]['consecutive_failures'])
-        return best_instance
+        self._healthy_order = sorted(self.instances, key=rank)
+    
+    def get_healthy_instance(self):
+        """Reserve a request slot on the healthy instance that can send soonest; returns (instance, wait)"""
+        with self._lock:
+            # All instances failing - fall back to the least failed, which ranks first
+            mask = self._healthy_mask
+            available = ([i for i in self._healthy_order if mask & (1 << self._instance_index[i])]
+                         or self._healthy_order[:1])
+            # Shortest wait spreads load across hosts; ties keep the ranked order
+            instance = min(available, key=lambda i: self._buckets[i].wait_time())
+            wait = self._buckets[instance].reserve()
+        return instance, wait
+    
+    def _set_instance_available(self, instance_url, available: bool):
+        """Open or close the circuit breaker bit for an instance (caller holds the lock)"""
+        bit = 1 << self._instance_index[instance_url]
+        if available:
+            self._healthy_mask |= bit
+        else:
+            self._healthy_mask &= ~bit
     
     def _mark_instance_unhealthy(self, instance_url, error_msg):
         """Mark instance as unhealthy and update failure tracking"""
-        health = self.instance_health[instance_url]
-        health.update({
-            'status': 'unhealthy',
-            'last_check': datetime.now(),
-            'consecutive_failures': health['consecutive_failures'] + 1,
-            'last_error': error_msg
-        })
-        
-        if health['consecutive_failures'] >= 3:
-            self.failed_instances.add(instance_url)
+        with self._lock:
+            health = self.instance_health[instance_url]
+            health.update({
+                'status': 'unhealthy',
+                'last_check': datetime.now(),
+                'consecutive_failures': health['consecutive_failures'] + 1,
+                'last_error': error_msg
+            })
+            
+            if health['consecutive_failures'] >= 3:
+                self._set_instance_available(instance_url, False)
+            
+            self._refresh_healthy_order()
     
     def check_instance_health(self, instance_url, timeout=5):
         """Check instance health using /api/v1/stats endpoint"""
@@ -345,24 +638,24 @@ class InvidiousCollector:
             stats_url = f"{instance_url}/api/v1/stats"
             start_time = time.time()
             
-            response = requests.get(stats_url, timeout=timeout, headers={
-                'User-Agent': 'Mozilla/5.0 (compatible; InvidiousCollector/1.0)'
-            })
+            response = self.session.get(stats_url, timeout=timeout)
             response_time = time.time() - start_time
             
             if response.status_code == 200:
                 try:
                     stats_data = response.json()
                     if isinstance(stats_data, dict) and 'version' in stats_data:
-                        self.instance_health[instance_url].update({
-                            'status': 'healthy',
-                            'last_check': datetime.now(),
-                            'response_time': response_time,
-                            'consecutive_failures': 0,
-                            'last_success': datetime.now(),
-                            'last_error': None
-                        })
-                        self.failed_instances.discard(instance_url)
+                        with self._lock:
+                            self.instance_health[instance_url].update({
+                                'status': 'healthy',
+                                'last_check': datetime.now(),
+                                'response_time': response_time,
+                                'consecutive_failures': 0,
+                                'last_success': datetime.now(),
+                                'last_error': None
+                            })
+                            self._set_instance_available(instance_url, True)
+                            self._refresh_healthy_order()
                         return True, stats_data
                     else:
                         self._mark_instance_unhealthy(instance_url, "Invalid stats response format")
@@ -378,38 +671,44 @@ class InvidiousCollector:
             self._mark_instance_unhealthy(instance_url, str(e))
             return False, str(e)
     
-    def make_api_request(self, endpoint, params=None):
+    def make_api_request(self, endpoint, params=None, stats=None):
         """Make API request with comprehensive error handling"""
+        data, error, _ = self._api_request(endpoint, params, stats)
+        return data, error
+    
+    def _api_request(self, endpoint, params=None, stats=None):
+        """make_api_request that also returns the instance which served the response"""
         if params is None:
             params = {}
-        
-        # Rate limiting
-        current_time = time.time()
-        if current_time - self.last_request_time < self.min_request_interval:
-            time.sleep(self.min_request_interval - (current_time - self.last_request_time))
+        # Worker threads pass their own counters; st.session_state is script-thread only
+        if stats is None:
+            stats = st.session_state.collector_stats
         
         for attempt in range(self.max_retries):
-            instance = self.get_healthy_instance()
+            instance, wait = self.get_healthy_instance()
+            if wait > 0:
+                time.sleep(wait)  # Rate limiting
             url = f"{instance}{endpoint}"
             
             try:
-                self.instance_health[instance]['total_requests'] += 1
-                self.last_request_time = time.time()
-                st.session_state.collector_stats['api_calls_invidious'] += 1
+                with self._lock:
+                    self.instance_health[instance]['total_requests'] += 1
+                stats['api_calls_invidious'] += 1
                 
-                response = requests.get(url, params=params, timeout=self.request_timeout, 
-                                      headers={'User-Agent': 'Mozilla/5.0 (compatible; InvidiousCollector/1.0)'})
+                response = self.session.get(url, params=params, timeout=self.request_timeout)
                 
                 if response.status_code == 200:
                     try:
                         json_data = response.json()
                         
                         if isinstance(json_data, (dict, list)) and json_data is not None:
-                            self.instance_health[instance]['successful_requests'] += 1
-                            self.instance_health[instance]['consecutive_failures'] = 0
-                            self.failed_instances.discard(instance)
-                            st.session_state.collector_stats['invidious_successes'] += 1
-                            return json_data, None
+                            with self._lock:
+                                self.instance_health[instance]['successful_requests'] += 1
+                                self.instance_health[instance]['consecutive_failures'] = 0
+                                self._set_instance_available(instance, True)
+                                self._refresh_healthy_order()
+                            stats['invidious_successes'] += 1
+                            return json_data, None, instance
                         else:
                             self._mark_instance_unhealthy(instance, "Empty or invalid response data")
                             continue
@@ -430,13 +729,13 @@ class InvidiousCollector:
                     self._mark_instance_unhealthy(instance, f"HTTP {response.status_code}")
                     continue
                     
-            except requests.RequestException as e:
+            except HTTP_ERRORS as e:
                 self._mark_instance_unhealthy(instance, str(e))
                 if attempt < self.max_retries - 1:
                     time.sleep(self.retry_delay_base * (2 ** attempt))
                 continue
         
-        return None, "All Invidious instances failed"
+        return None, "All Invidious instances failed", None
     
     def search_videos(self, query, max_results=25):
         """Search videos using Invidious API"""
@@ -462,29 +761,63 @@ class InvidiousCollector:
         else:
             return []
     
-    def fetch_video_metadata(self, video_id):
-        """Fetch video metadata with format validation"""
-        data, error = self.make_api_request(f"/api/v1/videos/{video_id}")
+    def fetch_video_metadata(self, video_id, stats=None):
+        """Fetch video metadata with format validation; returns (metadata, error, served_by)"""
+        if self.metadata_cache:
+            cached = self.metadata_cache.get(video_id)
+            if cached is not None:
+                return cached, None, 'cache'
+        
+        data, error, instance = self._api_request(f"/api/v1/videos/{video_id}", stats=stats)
         
         if error:
-            return None, error
+            return None, error, None
             
         if not isinstance(data, dict):
-            return None, "Invalid metadata format"
+            return None, "Invalid metadata format", None
             
         required_fields = ['videoId', 'title']
         missing_fields = [field for field in required_fields if not data.get(field)]
         
         if missing_fields:
-            return None, f"Missing required fields: {', '.join(missing_fields)}"
+            return None, f"Missing required fields: {', '.join(missing_fields)}", None
+        
+        if self.metadata_cache:
+            self.metadata_cache.put(video_id, data)
         
-        return data, None
+        return data, None, instance.replace('https://', '')
+    
+    def fetch_many(self, video_ids: List[str]) -> Dict[str, Tuple[Optional[Dict], Optional[str], Optional[str]]]:
+        """Fetch metadata for several videos concurrently, keyed by video_id"""
+        if not video_ids:
+            return {}
+        
+        def fetch(video_id):
+            stats = {'api_calls_invidious': 0, 'invidious_successes': 0}
+            return video_id, self.fetch_video_metadata(video_id, stats=stats), stats
+        
+        workers = min(len(video_ids), self.max_concurrent_requests)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetched = list(executor.map(fetch, video_ids))
+        
+        # Merge worker counters back on the script thread
+        results = {}
+        for video_id, result, stats in fetched:
+            results[video_id] = result
+            for key, value in stats.items():
+                st.session_state.collector_stats[key] += value
+        
+        return results
+    
+    def warm_all_instances(self):
+        """Probe every instance concurrently; returns (instance, (is_healthy, result)) pairs"""
+        with ThreadPoolExecutor(max_workers=len(self.instances)) as executor:
+            return list(zip(self.instances, executor.map(self.check_instance_health, self.instances)))
     
     def validate_all_instances(self):
         """Validate all Invidious instances before starting collection"""
         healthy_instances = 0
-        for instance in self.instances:
-            is_healthy, result = self.check_instance_health(instance)
+        for instance, (is_healthy, result) in self.warm_all_instances():
             if is_healthy:
                 healthy_instances += 1
                 self.add_log(f"Instance {instance.replace('https://', '')} is healthy", "SUCCESS")
@@ -533,6 +866,25 @@ class InvidiousCollector:
         return stats
 
 
+@st.cache_resource(show_spinner=False)
+def get_invidious_collector() -> InvidiousCollector:
+    """One collector, HTTP session and health record shared by collection runs and the dashboard"""
+    return InvidiousCollector(metadata_cache=get_metadata_cache())
+
+
+def _serialize_cell(value) -> str:
+    """Default sheet cell serializer: JSON for containers, '' for empty values"""
+    if isinstance(value, (list, dict)):
+        value = json.dumps(value)
+    return str(value) if value else ''
+
+
+# Per-column cell serializers; columns not listed use _serialize_cell
+_CELL_SERIALIZERS = {
+    'tags': lambda value: ','.join(value) if isinstance(value, list) else _serialize_cell(value)
+}
+
+
 class RateLimitedSheetsExporter:
     """Google Sheets exporter with rate limiting"""
     
@@ -546,6 +898,12 @@ class RateLimitedSheetsExporter:
         self.request_count = 0
         self.last_request_time = 0
         self.requests_per_minute_limit = 200
+        # Keep append payloads well under the API request size limit
+        self.max_append_bytes = 5 * 1024 * 1024
+        
+        # Opened handles, so open_by_key/worksheet lookups are paid once per sheet
+        self._spreadsheet_cache = {}
+        self._worksheet_cache = {}
     
     def _rate_limit_sheets_request(self):
         """Rate limit Google Sheets requests"""
@@ -565,8 +923,39 @@ class RateLimitedSheetsExporter:
         self.request_count += 1
     
     def get_spreadsheet_by_id(self, spreadsheet_id: str):
-        self._rate_limit_sheets_request()
-        return self.client.open_by_key(spreadsheet_id)
+        if spreadsheet_id not in self._spreadsheet_cache:
+            self._rate_limit_sheets_request()
+            self._spreadsheet_cache[spreadsheet_id] = self.client.open_by_key(spreadsheet_id)
+        return self._spreadsheet_cache[spreadsheet_id]
+    
+    def get_worksheet(self, spreadsheet_id: str, worksheet_name: str, create: bool = False):
+        """Get a worksheet by name; create it if missing only when asked, else raise WorksheetNotFound"""
+        key = (spreadsheet_id, worksheet_name)
+        if key not in self._worksheet_cache:
+            spreadsheet = self.get_spreadsheet_by_id(spreadsheet_id)
+            self._rate_limit_sheets_request()
+            try:
+                worksheet = spreadsheet.worksheet(worksheet_name)
+            except gspread.exceptions.WorksheetNotFound:
+                if not create:
+                    raise
+                worksheet = spreadsheet.add_worksheet(title=worksheet_name, rows=1000, cols=30)
+            self._worksheet_cache[key] = worksheet
+        return self._worksheet_cache[key]
+    
+    def _read_worksheet(self, spreadsheet_id: str, worksheet_name: str, read, create: bool = False):
+        """Return (worksheet, read(worksheet)), re-opening stale cached handles once"""
+        for attempt in range(2):
+            try:
+                worksheet = self.get_worksheet(spreadsheet_id, worksheet_name, create=create)
+                self._rate_limit_sheets_request()
+                return worksheet, read(worksheet)
+            except (gspread.exceptions.APIError, gspread.exceptions.WorksheetNotFound):
+                if attempt:
+                    raise
+                # Sheet deleted or renamed since it was cached - look it up again
+                self._worksheet_cache.pop((spreadsheet_id, worksheet_name), None)
+                self._spreadsheet_cache.pop(spreadsheet_id, None)
     
     def export_to_sheets_enhanced(self, videos: List[Dict], spreadsheet_id: str = None):
         """Export videos with enhanced metadata to raw_links sheet"""
@@ -574,13 +963,10 @@ class RateLimitedSheetsExporter:
             if not videos:
                 return None
             
+            # Only the first two rows are needed to tell whether data exists
+            worksheet, existing_data = self._read_worksheet(spreadsheet_id, "raw_links",
+                                                            lambda ws: ws.get('A1:A2'), create=True)
             spreadsheet = self.get_spreadsheet_by_id(spreadsheet_id)
-            worksheet_name = "raw_links"
-            
-            try:
-                worksheet = spreadsheet.worksheet(worksheet_name)
-            except gspread.exceptions.WorksheetNotFound:
-                worksheet = spreadsheet.add_worksheet(title=worksheet_name, rows=1000, cols=30)
             
             # Enhanced headers for additional metadata
             enhanced_headers = [
@@ -590,18 +976,15 @@ class RateLimitedSheetsExporter:
                 'full_description', 'collection_source', 'collection_instance_used'
             ]
             
-            existing_data = worksheet.get_all_values()
+            # Append all videos in one batch instead of one request per row
+            rows = [self._prepare_enhanced_row(video, enhanced_headers) for video in videos]
             
             if not existing_data or len(existing_data) <= 1:
                 worksheet.clear()
-                self._rate_limit_sheets_request()
-                worksheet.append_row(enhanced_headers)
+                # Header goes out in the same request as the data
+                rows.insert(0, enhanced_headers)
             
-            # Add videos with rate limiting
-            for video in videos:
-                enhanced_row = self._prepare_enhanced_row(video, enhanced_headers)
-                self._rate_limit_sheets_request()
-                worksheet.append_row(enhanced_row)
+            self._append_values(spreadsheet, worksheet, rows)
             
             return spreadsheet.url
             
@@ -609,38 +992,89 @@ class RateLimitedSheetsExporter:
             st.error(f"Sheets export error: {str(e)}")
             return None
     
+    def get_existing_video_ids(self, spreadsheet_id: str) -> set:
+        """Fetch the video_id column of raw_links in a single request; a missing sheet has no ids"""
+        try:
+            _, column = self._read_worksheet(spreadsheet_id, "raw_links", lambda ws: ws.col_values(1))
+        except gspread.exceptions.WorksheetNotFound:
+            return set()
+        return set(column[1:])
+    
+    def _append_values(self, spreadsheet, worksheet, rows: List[List[str]]):
+        """Append rows via values.append, one rate-limited request per size-bounded chunk"""
+        range_name = gspread.utils.absolute_range_name(worksheet.title, 'A1')
+        params = {'valueInputOption': 'RAW', 'insertDataOption': 'INSERT_ROWS'}
+        
+        chunk, chunk_bytes = [], 0
+        for row in rows:
+            row_bytes = sum(len(cell) for cell in row)
+            if chunk and chunk_bytes + row_bytes > self.max_append_bytes:
+                self._rate_limit_sheets_request()
+                spreadsheet.values_append(range_name, params, {'values': chunk})
+                chunk, chunk_bytes = [], 0
+            chunk.append(row)
+            chunk_bytes += row_bytes
+        
+        if chunk:
+            self._rate_limit_sheets_request()
+            spreadsheet.values_append(range_name, params, {'values': chunk})
+    
     def _prepare_enhanced_row(self, video: Dict, headers: List[str]) -> List[str]:
         """Prepare enhanced row with all metadata fields"""
-        row = []
-        for header in headers:
-            value = video.get(header, '')
-            
-            if header == 'tags' and isinstance(value, list):
-                value = ','.join(value)
-            elif isinstance(value, (list, dict)):
-                value = json.dumps(value)
-            
-            row.append(str(value) if value else '')
-        
-        return row
+        return [_CELL_SERIALIZERS.get(header, _serialize_cell)(video.get(header, ''))
+                for header in headers]
+
+
+@st.cache_resource(show_spinner=False)
+def get_sheets_exporter(credentials_json: str) -> RateLimitedSheetsExporter:
+    """Build one exporter per service account and reuse it across reruns"""
+    return RateLimitedSheetsExporter(json.loads(credentials_json))
 
 
 class SimpleVideoCollector:
     """Simplified video collector focused on working functionality"""
     
-    def __init__(self, youtube_api_key: str = None, sheets_exporter=None):
-        self.invidious_collector = InvidiousCollector()
+    # Title keywords per category, compiled once and shared by all validators
+    _CATEGORY_KEYWORDS = {
+        'heartwarming': ('heartwarming', 'touching', 'emotional', 'reunion', 'surprise'),
+        'funny': ('funny', 'comedy', 'humor', 'hilarious', 'laugh'),
+        'traumatic': ('accident', 'disaster', 'emergency', 'rescue', 'shocking')
+    }
+    # One alternation per category scans a title once; IGNORECASE avoids a lowered copy
+    _CATEGORY_PATTERNS = {
+        category: re.compile('|'.join(re.escape(kw) for kw in keywords), re.IGNORECASE)
+        for category, keywords in _CATEGORY_KEYWORDS.items()
+    }
+    
+    # Accepted video length in seconds
+    _MIN_DURATION = 90
+    _MAX_DURATION = 600
+    
+    def __init__(self, youtube_api_key: str = None, sheets_exporter=None,
+                 invidious_collector: Optional[InvidiousCollector] = None):
+        self.invidious_collector = invidious_collector or get_invidious_collector()
         self.youtube_api_key = youtube_api_key
         self.sheets_exporter = sheets_exporter
         self.existing_sheet_ids = set()
         self.discarded_urls = set()
+        
+        # YouTube Data API client, built on first use for videos Invidious could not provide
+        self._yt = None
+        # Turned off for the rest of a run after the first failed fallback call
+        self.youtube_fallback_enabled = True
+    
+    @property
+    def youtube(self):
+        """Lazily build the YouTube client so reruns that never fall back skip discovery"""
+        if self._yt is None and self.youtube_api_key and YOUTUBE_API_AVAILABLE:
+            self._yt = build('youtube', 'v3', developerKey=self.youtube_api_key, cache_discovery=False)
+        return self._yt
     
     def add_log(self, message: str, log_type: str = "INFO"):
         """Add log entry"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = log_timestamp()
         log_entry = f"[{timestamp}] COLLECTOR {log_type}: {message}"
-        st.session_state.logs.insert(0, log_entry)
-        st.session_state.logs = st.session_state.logs[:100]
+        append_log(log_entry, log_type)
     
     def validate_video_simple(self, video_data: Dict, target_category: str) -> Tuple[bool, str]:
         """Simple video validation"""
@@ -665,13 +1099,16 @@ class SimpleVideoCollector:
                 duration_seconds = int(duration_raw)
             elif isinstance(duration_raw, str) and duration_raw.isdigit():
                 duration_seconds = int(duration_raw)
+            elif isinstance(duration_raw, str) and duration_raw.startswith('PT'):
+                duration_seconds = parse_iso_duration(duration_raw)
             else:
                 return False, f"Invalid duration format: {duration_raw}"
         except (ValueError, TypeError):
             return False, "Could not parse duration"
         
-        if duration_seconds < 90 or duration_seconds > 600:
-            return False, f"Duration out of range: {duration_seconds}s (need 90-600s)"
+        duration_ok, reason = self._check_duration(duration_seconds)
+        if not duration_ok:
+            return False, reason
         
         # View count check
         try:
@@ -689,20 +1126,132 @@ class SimpleVideoCollector:
             return False, "Could not parse view count"
         
         # Category check
-        title_lower = title.lower()
-        category_keywords = {
-            'heartwarming': ['heartwarming', 'touching', 'emotional', 'reunion', 'surprise'],
-            'funny': ['funny', 'comedy', 'humor', 'hilarious', 'laugh'],
-            'traumatic': ['accident', 'disaster', 'emergency', 'rescue', 'shocking']
-        }
-        
-        keywords = category_keywords.get(target_category, [])
-        if not any(kw in title_lower for kw in keywords):
+        if not self._title_matches_category(title, target_category):
             return False, f"No {target_category} keywords in title"
         
         return True, "Valid"
     
-    def collect_videos_simple(self, target_count: int, category: str, progress_callback=None):
+    def _check_duration(self, seconds: int) -> Tuple[bool, str]:
+        """Check a video length against the accepted duration range"""
+        if not self._MIN_DURATION <= seconds <= self._MAX_DURATION:
+            return False, f"Duration out of range: {seconds}s (need {self._MIN_DURATION}-{self._MAX_DURATION}s)"
+        return True, "Valid"
+    
+    def _title_matches_category(self, title: str, category: str) -> bool:
+        """Check whether a title contains any keyword for the category"""
+        pattern = self._CATEGORY_PATTERNS.get(category)
+        return bool(pattern and pattern.search(title))
+    
+    def _pre_filter(self, item: Dict, category: str) -> Tuple[bool, str]:
+        """Cheap checks on a search result before fetching full metadata"""
+        video_id = item.get('videoId')
+        
+        if video_id in st.session_state.collected_video_ids:
+            return False, "Duplicate (current session)"
+        
+        if video_id in self.existing_sheet_ids:
+            return False, "Already in sheet"
+        
+        if f"https://youtube.com/watch?v={video_id}" in self.discarded_urls:
+            return False, "Previously discarded"
+        
+        # Search results carry length and title, so obvious misses never need the detail call
+        length = item.get('lengthSeconds')
+        if isinstance(length, int):
+            duration_ok, reason = self._check_duration(length)
+            if not duration_ok:
+                return False, reason
+        
+        title = item.get('title')
+        if isinstance(title, str) and title and not self._title_matches_category(title, category):
+            return False, f"No {category} keywords in title"
+        
+        return True, "Valid"
+    
+    def prepare_video_record(self, video_id: str, metadata: Dict, category: str, query: str,
+                             served_by: str = '') -> Dict:
+        """Build the collected video record from Invidious-shaped metadata"""
+        return {
+            'video_id': video_id,
+            'title': str(metadata.get('title', '')),
+            'url': f"https://youtube.com/watch?v={video_id}",
+            'category': category,
+            'search_query': query,
+            'duration_seconds': as_int(metadata, 'lengthSeconds'),
+            'view_count': as_int(metadata, 'viewCount'),
+            'like_count': as_int(metadata, 'likeCount'),
+            'comment_count': as_int(metadata, 'commentCount'),
+            'published_at': str(metadata.get('publishedText', '')),
+            'channel_title': str(metadata.get('author', '')),
+            'tags': ','.join(metadata.get('keywords', [])),
+            'collected_at': datetime.now().isoformat(),
+            'full_description': str(metadata.get('description', '')),
+            'collection_source': metadata.get('collectionSource', 'invidious'),
+            'collection_instance_used': served_by
+        }
+    
+    def _youtube_to_metadata(self, item: Dict) -> Dict:
+        """Map a YouTube videos.list item onto the Invidious metadata fields we use"""
+        snippet = item.get('snippet', {})
+        statistics = item.get('statistics', {})
+        details = item.get('contentDetails', {})
+        
+        return {
+            'videoId': item.get('id'),
+            'title': snippet.get('title', ''),
+            'lengthSeconds': parse_iso_duration(details.get('duration', '')),
+            'viewCount': as_int(statistics, 'viewCount'),
+            'likeCount': as_int(statistics, 'likeCount'),
+            'commentCount': as_int(statistics, 'commentCount'),
+            'publishedText': snippet.get('publishedAt', ''),
+            'author': snippet.get('channelTitle', ''),
+            'keywords': snippet.get('tags', []),
+            'description': snippet.get('description', ''),
+            'collectionSource': 'youtube'
+        }
+    
+    def fetch_youtube_metadata_batch(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """Fetch metadata for Invidious misses from the YouTube API, 50 ids per call"""
+        results = {}
+        if not self.youtube_fallback_enabled or not video_ids or not self.youtube:
+            return results
+        
+        for start in range(0, len(video_ids), 50):
+            chunk = video_ids[start:start + 50]
+            try:
+                st.session_state.collector_stats['api_calls_youtube'] += 1
+                response = self.youtube.videos().list(
+                    part='snippet,statistics,contentDetails',
+                    id=','.join(chunk)
+                ).execute()
+            except YOUTUBE_API_ERRORS as e:
+                self.youtube_fallback_enabled = False
+                self.add_log(f"YouTube API fallback failed, disabled for this run: {str(e)}", "ERROR")
+                break
+            
+            for item in response.get('items', []):
+                metadata = self._youtube_to_metadata(item)
+                results[metadata['videoId']] = metadata
+                if self.invidious_collector.metadata_cache:
+                    self.invidious_collector.metadata_cache.put(metadata['videoId'], metadata,
+                                                                source='youtube')
+        
+        st.session_state.collector_stats['youtube_fallbacks'] += len(results)
+        return results
+    
+    def refresh_existing_ids(self, spreadsheet_id: str):
+        """Load video ids already in the sheet once, so validation never calls Sheets"""
+        if not self.sheets_exporter or not spreadsheet_id:
+            return
+        
+        try:
+            self.existing_sheet_ids = self.sheets_exporter.get_existing_video_ids(spreadsheet_id)
+            self.add_log(f"Loaded {len(self.existing_sheet_ids)} existing sheet video ids", "INFO")
+        except Exception as e:
+            self.add_log(f"Could not load existing sheet ids: {str(e)}", "WARNING")
+    
+    def collect_videos_simple(self, target_count: int, category: str, progress_callback=None,
+                              spreadsheet_id: str = None):
         """Simple video collection"""
         collected = []
         
@@ -712,14 +1261,25 @@ class SimpleVideoCollector:
             self.add_log(f"Instance validation failed: {instance_msg}", "ERROR")
             return []
         
+        self.refresh_existing_ids(spreadsheet_id)
+        self.youtube_fallback_enabled = True
+        
         self.add_log(f"Starting collection: {target_count} videos, category: {category}", "INFO")
         
         attempts = 0
         max_attempts = 50
         videos_checked = set()
+        # Ids already rejected for this category in earlier runs need no second metadata fetch
+        rejected_ids = st.session_state.rejected_video_ids.setdefault(category, set())
+        
+        # Rotate through a shuffled query plan so each query is tried before any repeats
+        plan = list(self.invidious_collector.search_queries[category])
+        random.shuffle(plan)
+        plan = deque(plan)
         
         while len(collected) < target_count and attempts < max_attempts:
-            query = random.choice(self.invidious_collector.search_queries[category])
+            query = plan[0]
+            plan.rotate(-1)
             self.add_log(f"Searching '{category}': {query}", "INFO")
             
             search_results = self.invidious_collector.search_videos(query, max_results=20)
@@ -728,74 +1288,186 @@ class SimpleVideoCollector:
                 attempts += 1
                 continue
             
+            # Per-batch counters, flushed to session state after the batch
+            local_checked = local_found = local_rejected = 0
+            
+            # Cheap checks first, so only surviving candidates cost a metadata request
+            candidates = []
             for item in search_results:
-                if len(collected) >= target_count:
-                    break
-                
                 video_id = item.get('videoId')
-                if not video_id or video_id in videos_checked:
+                if not video_id or video_id in videos_checked or video_id in rejected_ids:
                     continue
                 
                 videos_checked.add(video_id)
-                st.session_state.collector_stats['checked'] += 1
+                local_checked += 1
                 
-                # Get detailed metadata
-                metadata, error = self.invidious_collector.fetch_video_metadata(video_id)
-                if error or not metadata:
+                # Reject on search-result fields before the metadata request
+                passed, reason = self._pre_filter(item, category)
+                if not passed:
+                    local_rejected += 1
+                    self.add_log(f"Rejected: {reason}", "WARNING")
                     continue
                 
-                # Validate
-                is_valid, reason = self.validate_video_simple(metadata, category)
+                candidates.append(video_id)
+            
+            # Fetch metadata concurrently in small batches, stopping once the target is met
+            batch_size = self.invidious_collector.max_concurrent_requests
+            for start in range(0, len(candidates), batch_size):
+                if len(collected) >= target_count:
+                    break
+                
+                batch = candidates[start:start + batch_size]
+                metadata_by_id = self.invidious_collector.fetch_many(batch)
+                
+                # One batched YouTube call covers every id Invidious missed
+                missed = [vid for vid in batch if metadata_by_id[vid][0] is None]
+                if missed and self.youtube_fallback_enabled and self.youtube:
+                    for vid, metadata in self.fetch_youtube_metadata_batch(missed).items():
+                        metadata_by_id[vid] = (metadata, None, 'youtube')
                 
-                if is_valid:
-                    video_record = {
-                        'video_id': video_id,
-                        'title': str(metadata.get('title', '')),
-                        'url': f"https://youtube.com/watch?v={video_id}",
-                        'category': category,
-                        'search_query': query,
-                        'duration_seconds': int(metadata.get('lengthSeconds', 0)),
-                        'view_count': int(metadata.get('viewCount', 0)),
-                        'like_count': int(metadata.get('likeCount', 0)),
-                        'comment_count': int(metadata.get('commentCount', 0)),
-                        'published_at': str(metadata.get('publishedText', '')),
-                        'channel_title': str(metadata.get('author', '')),
-                        'tags': ','.join(metadata.get('keywords', [])),
-                        'collected_at': datetime.now().isoformat(),
-                        'full_description': str(metadata.get('description', '')),
-                        'collection_source': 'invidious',
-                        'collection_instance_used': str(self.invidious_collector.current_instance_index)
-                    }
+                # Validate in search-result order
+                for video_id in batch:
+                    if len(collected) >= target_count:
+                        break
                     
-                    collected.append(video_record)
-                    st.session_state.collected_videos.append(video_record)
-                    st.session_state.collector_stats['found'] += 1
+                    metadata, error, served_by = metadata_by_id[video_id]
+                    if error or not metadata:
+                        continue
                     
-                    self.add_log(f"Added: {video_record['title'][:50]}", "SUCCESS")
+                    is_valid, reason = self.validate_video_simple(metadata, category)
                     
-                    if progress_callback:
-                        progress_callback(len(collected), target_count)
-                else:
-                    st.session_state.collector_stats['rejected'] += 1
-                    self.add_log(f"Rejected: {reason}", "WARNING")
-                
-                time.sleep(0.5)  # Rate limiting
+                    if is_valid:
+                        video_record = self.prepare_video_record(video_id, metadata, category, query, served_by)
+                        
+                        collected.append(video_record)
+                        st.session_state.collected_videos.append(video_record)
+                        st.session_state.collected_video_ids.add(video_id)
+                        local_found += 1
+                        
+                        self.add_log(f"Added: {video_record['title'][:50]}", "SUCCESS")
+                        
+                        if progress_callback:
+                            progress_callback(len(collected), target_count)
+                    else:
+                        rejected_ids.add(video_id)
+                        local_rejected += 1
+                        self.add_log(f"Rejected: {reason}", "WARNING")
+            
+            stats = st.session_state.collector_stats
+            stats['checked'] += local_checked
+            stats['found'] += local_found
+            stats['rejected'] += local_rejected
             
             attempts += 1
-            time.sleep(1)
         
         return collected
 
 
+# Button callbacks run before the natural rerun, so no st.rerun() is needed
+def stop_collection():
+    set_status('warning', "COLLECTION STOPPED: Process terminated by user")
+    st.session_state.is_collecting = False
+
+
+def reset_stats():
+    st.session_state.collected_videos = []
+    st.session_state.collected_video_ids = set()
+    st.session_state.videos_df = None
+    st.session_state.last_exported_n = 0
+    st.session_state.rejected_video_ids = {}
+    st.session_state.collector_stats = {
+        'checked': 0, 'found': 0, 'rejected': 0, 
+        'api_calls_youtube': 0, 'api_calls_invidious': 0,
+        'invidious_successes': 0, 'youtube_fallbacks': 0,
+        'has_captions': 0, 'no_captions': 0
+    }
+    st.session_state.logs = deque(maxlen=LOG_LIMIT)
+    st.session_state.logs_by_level = new_log_levels()
+    clear_status()
+
+
+@st_fragment
+def render_collected_videos():
+    """Render the collected videos table; its widgets rerun only this fragment"""
+    if st.session_state.collected_videos:
+        st.subheader("Collected Videos")
+        videos = st.session_state.collected_videos
+        
+        if len(videos) < SMALL_TABLE_ROWS:
+            # Small collections render as a plain table, skipping pandas and Arrow
+            st.table([{col: video.get(col, '') for col in DISPLAY_COLUMNS} for video in videos])
+        else:
+            df = get_collected_videos_df()
+            
+            if AGGRID_AVAILABLE:
+                # The grid gets the whole collection, so sorting, filtering and paging
+                # all happen in the browser without a rerun
+                gb = GridOptionsBuilder.from_dataframe(df)
+                gb.configure_default_column(filter=True, sortable=True, resizable=True)
+                gb.configure_pagination(paginationPageSize=100)
+                AgGrid(df, gridOptions=gb.build(), enable_enterprise_modules=False,
+                       update_mode='NO_UPDATE')
+            else:
+                # Only ship the visible page to the browser
+                page_col1, page_col2 = st.columns(2)
+                with page_col1:
+                    page_size = st.selectbox("Rows per page", options=[50, 200, 1000], index=0)
+                with page_col2:
+                    page_count = max(1, (len(df) + page_size - 1) // page_size)
+                    page = st.number_input("Page", min_value=1, max_value=page_count, value=1)
+                
+                start = (page - 1) * page_size
+                view = df.iloc[start:start + page_size]
+                
+                st.dataframe(
+                    view,
+                    use_container_width=True,
+                    hide_index=True
+                )
+
+
+def log_block_html(level: str, lines: Iterable[str]) -> str:
+    """Render log lines of one severity as a single styled HTML block"""
+    body = '<br>'.join(html.escape(line) for line in lines)
+    return f'<div class="log-block log-{level.lower()}">{body}</div>'
+
+
+@st_fragment
+def render_activity_log():
+    """Render the activity log; its widgets rerun only this fragment"""
+    # A toggle instead of an expander so the collapsed log does no work at all
+    if st.checkbox("Show Activity Log", key="log_open"):
+        log_filter = st.selectbox("Show", options=('All',) + LOG_LEVELS, key="log_filter")
+        
+        if log_filter != 'All':
+            # Per-severity deques make a filtered view a direct lookup
+            level_logs = st.session_state.logs_by_level[log_filter]
+            if level_logs:
+                lines = islice(level_logs, LOG_DISPLAY_LIMIT)
+                st.markdown(log_block_html(log_filter, lines), unsafe_allow_html=True)
+            else:
+                st.info(f"No {log_filter} entries logged yet")
+        elif st.session_state.logs:
+            # Bucket by severity and emit every block in a single element
+            buckets = {level: [] for level in LOG_LEVELS}
+            for log in islice(st.session_state.logs, LOG_DISPLAY_LIMIT):
+                level = next((lvl for lvl in ('SUCCESS', 'ERROR', 'WARNING') if lvl in log), 'INFO')
+                buckets[level].append(log)
+            
+            blocks = ''.join(log_block_html(level, lines) for level, lines in buckets.items() if lines)
+            st.markdown(blocks, unsafe_allow_html=True)
+        else:
+            st.info("No activity logged yet")
+
+
 def main():
     # Configure autorefresh and show indicator
     refresh_count = 0
     
     if AUTOREFRESH_AVAILABLE:
-        if st.session_state.is_collecting:
-            refresh_count = st_autorefresh(interval=3000, key="collector")
-        else:
-            refresh_count = st_autorefresh(interval=30000, key="idle_monitor")
+        # Poll quickly only while work is running; idle pages refresh rarely
+        is_working = st.session_state.is_collecting or st.session_state.is_batch_collecting
+        refresh_count = st_autorefresh(interval=3000 if is_working else 30000, key="main_refresh")
         
         # Show refresh indicator with blinking status
         show_refresh_indicator(refresh_count)
@@ -826,7 +1498,7 @@ def main():
                 st.error(f"Invalid JSON: {str(e)}")
         
         spreadsheet_url = st.text_input("Google Sheet URL")
-        match = re.search(r'/d/([a-zA-Z0-9-_]+)', spreadsheet_url)
+        match = _SHEET_ID_RE.search(spreadsheet_url)
         spreadsheet_id = match.group(1) if match else spreadsheet_url
     
     # Show status alerts
@@ -841,6 +1513,7 @@ def main():
                                options=['heartwarming', 'funny', 'traumatic'])
         target_count = st.number_input("Target Video Count", min_value=1, max_value=100, value=10)
         auto_export = st.checkbox("Auto-export to Google Sheets", value=True)
+        st.button("Clear Metadata Cache", on_click=clear_metadata_cache)
     
     # Statistics display
     col1, col2, col3, col4 = st.columns(4)
@@ -857,19 +1530,22 @@ def main():
     # API Status Dashboard
     st.subheader("Invidious Instance Status")
     
-    invidious_collector = InvidiousCollector()
+    invidious_collector = get_invidious_collector()
     instance_stats = invidious_collector.get_instance_stats()
     
+    # One markdown element for all instances instead of one per instance
+    status_parts = []
     for instance, stats in instance_stats.items():
         instance_name = instance.replace('https://', '')
         status_text = f"{instance_name}: {stats['status'].title()}"
         
         if stats['consecutive_failures'] == 0:
-            st.markdown(f'<div class="api-status api-primary">{status_text}</div>', unsafe_allow_html=True)
+            status_parts.append(f'<div class="api-status api-primary">{status_text}</div>')
         elif stats['consecutive_failures'] < 3:
-            st.markdown(f'<div class="api-status api-fallback">{status_text} ({stats["consecutive_failures"]} failures)</div>', unsafe_allow_html=True)
+            status_parts.append(f'<div class="api-status api-fallback">{status_text} ({stats["consecutive_failures"]} failures)</div>')
         else:
-            st.markdown(f'<div class="api-status api-failed">{status_text} (Circuit breaker open)</div>', unsafe_allow_html=True)
+            status_parts.append(f'<div class="api-status api-failed">{status_text} (Circuit breaker open)</div>')
+    st.markdown(''.join(status_parts), unsafe_allow_html=True)
     
     # Control buttons
     col1, col2, col3 = st.columns([1, 1, 1])
@@ -888,9 +1564,11 @@ def main():
                 try:
                     exporter = None
                     if sheets_creds:
-                        exporter = RateLimitedSheetsExporter(sheets_creds)
+                        # Canonical JSON is the cache key for the shared exporter
+                        exporter = get_sheets_exporter(json.dumps(sheets_creds, sort_keys=True))
                     
-                    collector = SimpleVideoCollector(youtube_api_key, exporter)
+                    collector = SimpleVideoCollector(youtube_api_key, exporter,
+                                                     invidious_collector=invidious_collector)
                     
                     set_status('info', "COLLECTION STARTED: Validating instances...")
                     
@@ -906,7 +1584,8 @@ def main():
                         videos = collector.collect_videos_simple(
                             target_count=target_count,
                             category=category,
-                            progress_callback=update_progress
+                            progress_callback=update_progress,
+                            spreadsheet_id=spreadsheet_id
                         )
                     
                     if videos and len(videos) > 0:
@@ -914,15 +1593,21 @@ def main():
                     else:
                         set_status('warning', "COLLECTION COMPLETED: No videos found")
                     
-                    # Export
-                    if auto_export and sheets_creds and videos and len(videos) > 0:
+                    # Export only what earlier exports have not sent yet; a run with
+                    # auto-export off opts its videos out, so only failed exports are retried
+                    all_videos = st.session_state.collected_videos
+                    if not auto_export:
+                        st.session_state.last_exported_n = len(all_videos)
+                    pending = all_videos[st.session_state.last_exported_n:]
+                    if auto_export and sheets_creds and pending:
                         try:
-                            sheet_url = exporter.export_to_sheets_enhanced(videos, spreadsheet_id=spreadsheet_id)
+                            sheet_url = exporter.export_to_sheets_enhanced(pending, spreadsheet_id=spreadsheet_id)
                             
                             if sheet_url:
+                                st.session_state.last_exported_n = len(all_videos)
                                 st.success("Exported to Google Sheets!")
                                 st.markdown(f"[View Spreadsheet]({sheet_url})")
-                                set_status('success', f"EXPORT SUCCESS: {len(videos)} videos exported")
+                                set_status('success', f"EXPORT SUCCESS: {len(pending)} videos exported")
                             else:
                                 set_status('error', "EXPORT FAILED: Could not export to sheets")
                                 
@@ -937,52 +1622,17 @@ def main():
             st.rerun()
     
     with col2:
-        if st.button("Stop Collection", disabled=not st.session_state.is_collecting):
-            set_status('warning', "COLLECTION STOPPED: Process terminated by user")
-            st.session_state.is_collecting = False
-            st.rerun()
+        st.button("Stop Collection", disabled=not st.session_state.is_collecting,
+                  on_click=stop_collection)
     
     with col3:
-        if st.button("Reset Stats"):
-            st.session_state.collected_videos = []
-            st.session_state.collector_stats = {
-                'checked': 0, 'found': 0, 'rejected': 0, 
-                'api_calls_youtube': 0, 'api_calls_invidious': 0,
-                'invidious_successes': 0, 'youtube_fallbacks': 0,
-                'has_captions': 0, 'no_captions': 0
-            }
-            st.session_state.logs = []
-            clear_status()
-            st.rerun()
+        st.button("Reset Stats", on_click=reset_stats)
     
     # Display collected videos
-    if st.session_state.collected_videos:
-        st.subheader("Collected Videos")
-        df = pd.DataFrame(st.session_state.collected_videos)
-        
-        display_columns = ['title', 'category', 'view_count', 'duration_seconds', 'collection_source']
-        available_columns = [col for col in display_columns if col in df.columns]
-        
-        st.dataframe(
-            df[available_columns],
-            use_container_width=True,
-            hide_index=True
-        )
+    render_collected_videos()
     
     # Activity log
-    with st.expander("Activity Log", expanded=False):
-        if st.session_state.logs:
-            for log in st.session_state.logs[-20:]:
-                if "SUCCESS" in log:
-                    st.success(log)
-                elif "ERROR" in log:
-                    st.error(log)
-                elif "WARNING" in log:
-                    st.warning(log)
-                else:
-                    st.info(log)
-        else:
-            st.info("No activity logged yet")
+    render_activity_log()
 
 
 if __name__ == "__main__":